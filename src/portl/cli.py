@@ -6,12 +6,8 @@ import typer
 from typing import Optional
 from pathlib import Path
 
-from .ui.console import ConsoleUI
-from .commands.init_command import InitCommandHandler
-from .commands.run_command import RunCommandHandler
 from . import __version__
 
-console_ui = ConsoleUI()
 app = typer.Typer(
     name="portl",
     help="A developer-first CLI tool for moving data across databases, CSVs, and Google Sheets.\n\n"
@@ -23,7 +19,7 @@ app = typer.Typer(
 
 def version_callback(value: bool):
     if value:
-        console_ui.print_version(__version__)
+        typer.echo(f"portl version {__version__}")
         raise typer.Exit()
 
 
@@ -60,6 +56,8 @@ def init(
     - Conflict resolution strategies
     - Hooks and batch processing options
     """
+    from .commands.init_command import InitCommandHandler
+
     handler = InitCommandHandler()
     handler.handle(output=output, interactive=interactive)
 
@@ -88,6 +86,8 @@ def run(
     This command executes the data migration specified in the YAML file,
     with support for dry-run mode, custom batch sizes, and verbose logging.
     """
+    from .commands.run_command import RunCommandHandler
+
     handler = RunCommandHandler()
     handler.handle(
         job_file=job_file,
@@ -2,17 +2,29 @@ import typer
 from pathlib import Path
 from typing import Optional
 
-from ..services.template_service import TemplateService
-from ..services.job_runner import JobRunner, JobRunnerConfig
 from ..ui.console import ConsoleUI
 
 
 class RunCommandHandler:
     def __init__(self):
-        self.template_service = TemplateService()
-        self.job_runner = JobRunner()
+        self._template_service = None
+        self._job_runner = None
         self.ui = ConsoleUI()
     
+    @property
+    def template_service(self):
+        if self._template_service is None:
+            from ..services.template_service import TemplateService
+            self._template_service = TemplateService()
+        return self._template_service
+    
+    @property
+    def job_runner(self):
+        if self._job_runner is None:
+            from ..services.job_runner import JobRunner
+            self._job_runner = JobRunner()
+        return self._job_runner
+    
     def handle(
         self,
         job_file: Optional[Path] = None,
@@ -26,6 +38,8 @@ class RunCommandHandler:
                 return
             dry_run = True  # Force dry-run for templates
         
+        from ..services.job_runner import JobRunnerConfig
+        
         config = JobRunnerConfig(
             job_file=job_file,
             dry_run=dry_run,
@@ -43,9 +57,21 @@ class RunCommandHandler:
             self.ui.print_error(str(e))
             raise typer.Exit(1)
         
+        if not validation["valid"]:
+            for error in validation["errors"]:
+                self.ui.print_error(error)
+            raise typer.Exit(1)
+        
         self.ui.print_job_execution_banner(config)
         self.ui.print_job_options(config)
         
+        if verbose:
+            from ..utils.yaml_io import has_libyaml, parser_name
+            if parser_name() == "pyyaml" and not has_libyaml():
+                self.ui.print_info(
+                    "[dim]LibYAML bindings not found; using the slower pure-Python YAML parser[/dim]"
+                )
+        
         try:
             self.job_runner.execute_job(config)
             self.ui.print_coming_soon("Migration execution engine")
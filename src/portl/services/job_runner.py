@@ -1,6 +1,17 @@
+import errno
+import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from ..utils.yaml_cache import load_yaml_cached
+from ..utils.yaml_io import YamlParseError
+
+
+_YAML_SUFFIXES = frozenset({'.yaml', '.yml'})
+
+# stat() errors that Path.exists() treats as "does not exist"
+_MISSING_FILE_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.ELOOP})
+
 
 class JobRunnerConfig:
     def __init__(
@@ -18,21 +29,47 @@ class JobRunnerConfig:
 
 class JobRunner:
     def validate_job_file(self, job_file: Path) -> Dict[str, Any]:
-        if not job_file.exists():
-            raise FileNotFoundError(f"Job file not found: {job_file}")
+        stat_error: Optional[OSError] = None
+        try:
+            stat_result: Optional[os.stat_result] = os.stat(job_file)
+        except OSError as e:
+            if e.errno in _MISSING_FILE_ERRNOS:
+                raise FileNotFoundError(f"Job file not found: {job_file}") from None
+            stat_result, stat_error = None, e
         
-        validation_result = {
+        validation_result: Dict[str, Any] = {
             "valid": True,
             "warnings": [],
             "errors": []
         }
         
         # Check file extension
-        if job_file.suffix.lower() not in ['.yaml', '.yml']:
+        if job_file.suffix.lower() not in _YAML_SUFFIXES:
             validation_result["warnings"].append(
                 f"File '{job_file}' doesn't have a .yaml or .yml extension"
             )
         
+        try:
+            if stat_error is not None:
+                raise stat_error
+            content = load_yaml_cached(job_file, stat_result)
+        except YamlParseError as e:
+            validation_result["valid"] = False
+            validation_result["errors"].append(f"Invalid YAML in '{job_file}': {e}")
+            return validation_result
+        except OSError as e:
+            validation_result["valid"] = False
+            validation_result["errors"].append(
+                f"Cannot read job file '{job_file}': {e.strerror or e}"
+            )
+            return validation_result
+        
+        if not isinstance(content, dict):
+            validation_result["valid"] = False
+            validation_result["errors"].append(
+                f"Job file '{job_file}' must contain a YAML mapping at the top level"
+            )
+        
         # TODO: Add YAML structure validation here
         
         return validation_result
@@ -1,17 +1,25 @@
+from functools import cached_property
+from importlib.resources import files
 from pathlib import Path
 
 
+DEFAULT_TEMPLATE_NAME = "portl_template.yaml"
+
+
 class TemplateService:
     def __init__(self):
-        self._template_source = Path(__file__).parent.parent / "template.yaml"
+        self._template_source = files("portl").joinpath("template.yaml")
     
-    def get_template_content(self) -> str:
+    @cached_property
+    def _template_bytes(self) -> bytes:
         try:
-            with open(self._template_source, 'r', encoding='utf-8') as f:
-                return f.read()
+            return self._template_source.read_bytes()
         except FileNotFoundError:
             raise FileNotFoundError(f"Template file not found at {self._template_source}")
     
+    def get_template_content(self) -> str:
+        return self._template_bytes.decode('utf-8')
+    
     def create_template_file(self, output_path: Path, overwrite: bool = False) -> bool:
         """
         Create a template file at the specified path.
@@ -30,13 +38,10 @@ class TemplateService:
         if output_path.exists() and not overwrite:
             raise FileExistsError(f"Template file already exists: {output_path}")
         
-        template_content = self.get_template_content()
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(template_content)
+        output_path.write_bytes(self._template_bytes)
         
         return True
     
     def get_default_template_name(self) -> str:
         """Get the default template filename."""
-        return "portl_template.yaml"
+        return DEFAULT_TEMPLATE_NAME
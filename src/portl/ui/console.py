@@ -1,54 +1,88 @@
+from functools import lru_cache
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 from pathlib import Path
+from typing import Optional, TYPE_CHECKING
 
-from ..services.job_runner import JobRunnerConfig
+if TYPE_CHECKING:
+    from ..services.job_runner import JobRunnerConfig
+
+
+@lru_cache(maxsize=None)
+def get_console() -> Console:
+    """Return the process-wide Rich console, probing the terminal only once."""
+    return Console()
+
+
+# Banners are constant, so their markup is parsed once per process.
+_WELCOME_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold blue]Portl Migration Wizard[/bold blue]\n\n"
+        "This will help you create YAML job configurations for your data migrations."
+    ),
+    title="Welcome to Portl",
+    border_style="blue"
+)
+
+_NO_JOB_FILE_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold yellow]No job file specified[/bold yellow]\n\n"
+        "Would you like to create a template configuration file to get started?"
+    ),
+    title="Missing Configuration",
+    border_style="yellow"
+)
+
+_INIT_FEATURES = (
+    "\nThis will guide you through:\n"
+    "• Source type selection (Postgres/MySQL/CSV/Google Sheets)\n"
+    "• Connection details and authentication\n"
+    "• Schema mapping and transformations\n"
+    "• Conflict resolution strategies\n"
+    "• Hooks and performance configuration"
+)
+
+
+@lru_cache(maxsize=32)
+def _build_run_panel(job_file: str, dry_run: bool) -> Panel:
+    if dry_run:
+        return Panel.fit(
+            Text.assemble(
+                Text.from_markup("[bold yellow]Dry Run Mode[/bold yellow]\n\n"),
+                "Validating job configuration from: ",
+                (job_file, "cyan"),
+                "\nNo data will be modified during this run."
+            ),
+            border_style="yellow"
+        )
+    return Panel.fit(
+        Text.assemble(
+            Text.from_markup("[bold green]Running Migration Job[/bold green]\n\n"),
+            "Executing job from: ",
+            (job_file, "cyan")
+        ),
+        border_style="green"
+    )
 
 
 class ConsoleUI:
-    def __init__(self):
-        self.console = Console()
+    def __init__(self, console: Optional[Console] = None):
+        self.console = console if console is not None else get_console()
     
     def print_welcome_banner(self):
-        self.console.print(Panel.fit(
-            "[bold blue]Portl Migration Wizard[/bold blue]\n\n"
-            "This will help you create YAML job configurations for your data migrations.",
-            title="Welcome to Portl",
-            border_style="blue"
-        ))
+        self.console.print(_WELCOME_PANEL)
     
     def print_init_features(self):
-        self.console.print("\nThis will guide you through:")
-        self.console.print("• Source type selection (Postgres/MySQL/CSV/Google Sheets)")
-        self.console.print("• Connection details and authentication")
-        self.console.print("• Schema mapping and transformations")
-        self.console.print("• Conflict resolution strategies")
-        self.console.print("• Hooks and performance configuration")
+        self.console.print(_INIT_FEATURES)
     
     def print_no_job_file_prompt(self):
-        self.console.print(Panel.fit(
-            "[bold yellow]No job file specified[/bold yellow]\n\n"
-            "Would you like to create a template configuration file to get started?",
-            title="Missing Configuration",
-            border_style="yellow"
-        ))
+        self.console.print(_NO_JOB_FILE_PANEL)
     
-    def print_job_execution_banner(self, config: JobRunnerConfig):
-        if config.dry_run:
-            self.console.print(Panel.fit(
-                f"[bold yellow]Dry Run Mode[/bold yellow]\n\n"
-                f"Validating job configuration from: [cyan]{config.job_file}[/cyan]\n"
-                f"No data will be modified during this run.",
-                border_style="yellow"
-            ))
-        else:
-            self.console.print(Panel.fit(
-                f"[bold green]Running Migration Job[/bold green]\n\n"
-                f"Executing job from: [cyan]{config.job_file}[/cyan]",
-                border_style="green"
-            ))
+    def print_job_execution_banner(self, config: "JobRunnerConfig"):
+        self.console.print(_build_run_panel(str(config.job_file), config.dry_run))
     
-    def print_job_options(self, config: JobRunnerConfig):
+    def print_job_options(self, config: "JobRunnerConfig"):
         if config.batch_size:
             self.console.print(f"[dim]Using custom batch size: {config.batch_size}[/dim]")
         
@@ -75,9 +109,6 @@ class ConsoleUI:
     def print_info(self, message: str):
         self.console.print(message)
     
-    def print_version(self, version: str):
-        self.console.print(f"portl version {version}")
-    
     def print_coming_soon(self, feature: str):
         self.console.print(f"\n[yellow]{feature} coming soon![/yellow]")
     
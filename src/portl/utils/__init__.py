@@ -0,0 +1,6 @@
+"""
+Utilities module for Portl.
+
+This module contains small, dependency-light helpers shared by the
+services and command handlers.
+"""
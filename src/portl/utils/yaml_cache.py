@@ -0,0 +1,93 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .yaml_io import load_yaml_file, parser_name
+
+
+# In-process layer in front of the on-disk pickles, so a file validated
+# more than once in the same run is parsed (or unpickled) only once.
+_memory_cache: Dict[Tuple[str, int, int, str], Any] = {}
+
+# A file modified this recently could still change within the same mtime
+# tick without its (mtime, size) stamp changing ("racy" in git's terms), so
+# its parse is not written to disk until the timestamp has settled.
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+
+def get_cache_dir() -> Path:
+    """Directory holding parsed-YAML sidecars (``$XDG_CACHE_HOME/portl``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "portl"
+
+
+def clear_cache() -> None:
+    """Drop the in-process cache; on-disk entries are left untouched."""
+    _memory_cache.clear()
+
+
+def load_yaml_cached(path: Path, stat_result: Optional[os.stat_result] = None) -> Any:
+    """
+    Load a YAML file, reusing a pickled parse result from a previous run.
+    
+    Each file has one sidecar, named after its resolved path, that stores
+    the modification time, size and parser alongside the parsed data. An
+    edited file fails the stamp check and its sidecar is overwritten, so
+    the cache holds one entry per job file. Files modified in the last two
+    seconds are not written to disk, since a same-size edit within the same
+    mtime tick would go unnoticed. Cache failures are never fatal; the file
+    is simply parsed again. Pass ``stat_result`` when the caller has already
+    stat'ed the file to avoid a second syscall.
+    
+    Repeated calls within a process return the same object, so callers must
+    treat the result as read-only.
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+        YamlParseError: If the file is not valid YAML
+    """
+    st = stat_result if stat_result is not None else os.stat(path)
+    resolved = str(Path(path).resolve())
+    stamp = (st.st_mtime_ns, st.st_size, parser_name())
+    memory_key = (resolved, *stamp)
+    if memory_key in _memory_cache:
+        return _memory_cache[memory_key]
+    
+    cache_file: Optional[Path] = None
+    try:
+        cache_file = get_cache_dir() / f"{hashlib.sha1(resolved.encode('utf-8')).hexdigest()}.pkl"
+        with open(cache_file, 'rb') as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            _memory_cache[memory_key] = data
+            return data
+    except Exception:
+        pass
+    
+    data = load_yaml_file(path)
+    
+    racy = time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+    if cache_file is not None and not racy:
+        _write_sidecar(cache_file, stamp, data)
+    
+    _memory_cache[memory_key] = data
+    return data
+
+
+def _write_sidecar(cache_file: Path, stamp: Tuple[int, int, str], data: Any) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
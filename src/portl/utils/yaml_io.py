@@ -0,0 +1,87 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# PyYAML is imported on first use: a cache hit in yaml_cache never needs
+# it, and importing it (plus libyaml) is a noticeable share of CLI startup.
+
+# Job files are small; one large buffer turns the parser's many small reads
+# into a single read() syscall.
+IO_BUFFER_SIZE = 1 << 20
+
+
+class YamlParseError(ValueError):
+    """Raised when a document is not valid YAML."""
+
+
+@lru_cache(maxsize=None)
+def _import_ryaml():
+    # Optional Rust-backed parser from the ``portl[rust]`` extra.
+    try:
+        import ryaml  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return ryaml
+
+
+def _ryaml():
+    # ryaml parses YAML 1.2, which reads some scalars differently from
+    # PyYAML, so it is only used when explicitly requested.
+    if os.environ.get("PORTL_YAML_PARSER", "").lower() != "ryaml":
+        return None
+    return _import_ryaml()
+
+
+def parser_name() -> str:
+    """Name of the parser ``load_yaml`` uses: ``"ryaml"`` or ``"pyyaml"``."""
+    return "ryaml" if _ryaml() is not None else "pyyaml"
+
+
+@lru_cache(maxsize=None)
+def _safe_loader() -> type:
+    import yaml
+
+    # Prefer the libyaml C bindings when PyYAML was built with them; the
+    # pure-Python loader produces identical output but is much slower.
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def has_libyaml() -> bool:
+    """Whether PyYAML's libyaml-backed loader is available."""
+    import yaml
+
+    return _safe_loader() is not yaml.SafeLoader
+
+
+def load_yaml(stream: Any) -> Any:
+    """
+    Parse a YAML document from a string, bytes or open (binary) file.
+    
+    When ``PORTL_YAML_PARSER=ryaml`` is set and ryaml is installed it is
+    used instead of PyYAML. ryaml follows YAML 1.2, so unquoted ``yes``/``no``
+    and dates stay strings.
+    """
+    ryaml = _ryaml()
+    if ryaml is not None:
+        try:
+            if isinstance(stream, bytes):
+                return ryaml.loads(stream.decode('utf-8'))
+            if isinstance(stream, str):
+                return ryaml.loads(stream)
+            return ryaml.load(stream)
+        except (ryaml.InvalidYamlError, UnicodeDecodeError) as e:
+            raise YamlParseError(str(e)) from e
+    
+    import yaml
+
+    try:
+        return yaml.load(stream, Loader=_safe_loader())
+    except yaml.YAMLError as e:
+        raise YamlParseError(str(e)) from e
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file, letting the loader decode the raw bytes itself."""
+    with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        return load_yaml(f)
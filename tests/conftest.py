@@ -3,3 +3,16 @@ Pytest configuration file.
 """
 
 import pytest
+
+from portl.utils import yaml_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the parsed-YAML cache out of the user's real cache directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.delenv("PORTL_YAML_PARSER", raising=False)
+    yaml_cache.clear_cache()
+    yield cache_home / "portl"
+    yaml_cache.clear_cache()
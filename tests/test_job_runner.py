@@ -0,0 +1,53 @@
+import pytest
+from pathlib import Path
+from portl.services.job_runner import JobRunner
+
+
+def test_validate_job_file_valid_yaml(tmp_path):
+    job_file = tmp_path / "job.yaml"
+    job_file.write_text("source:\n  type: csv\nbatch_size: 100\n")
+    result = JobRunner().validate_job_file(job_file)
+    assert result["valid"] is True
+    assert result["errors"] == []
+
+
+def test_validate_job_file_invalid_yaml(tmp_path):
+    job_file = tmp_path / "job.yaml"
+    job_file.write_text("source: [unclosed\n")
+    result = JobRunner().validate_job_file(job_file)
+    assert result["valid"] is False
+    assert "Invalid YAML" in result["errors"][0]
+
+
+def test_validate_job_file_requires_mapping(tmp_path):
+    job_file = tmp_path / "job.yaml"
+    job_file.write_text("- just\n- a list\n")
+    result = JobRunner().validate_job_file(job_file)
+    assert result["valid"] is False
+
+
+def test_validate_job_file_missing():
+    with pytest.raises(FileNotFoundError):
+        JobRunner().validate_job_file(Path("does-not-exist.yaml"))
+
+
+def test_validate_job_file_directory(tmp_path):
+    job_dir = tmp_path / "job.yaml"
+    job_dir.mkdir()
+    result = JobRunner().validate_job_file(job_dir)
+    assert result["valid"] is False
+    assert "Cannot read job file" in result["errors"][0]
+
+
+def test_validate_job_file_under_regular_file(tmp_path):
+    parent = tmp_path / "f.yaml"
+    parent.write_text("a: 1\n")
+    with pytest.raises(FileNotFoundError, match="Job file not found"):
+        JobRunner().validate_job_file(parent / "child.yaml")
+
+
+def test_validate_job_file_symlink_loop(tmp_path):
+    link = tmp_path / "loop.yaml"
+    link.symlink_to(link)
+    with pytest.raises(FileNotFoundError, match="Job file not found"):
+        JobRunner().validate_job_file(link)
@@ -0,0 +1,18 @@
+from typer.testing import CliRunner
+from portl.cli import app
+
+
+def test_run_invalid_yaml_reports_errors(tmp_path):
+    job_file = tmp_path / "bad.yaml"
+    job_file.write_text("source: [unclosed\n")
+    result = CliRunner().invoke(app, ["run", str(job_file)])
+    assert result.exit_code == 1
+    assert "Invalid YAML" in result.output
+    assert "Dry Run Mode" not in result.output
+    assert "Running Migration Job" not in result.output
+
+
+def test_run_directory_reports_error(tmp_path):
+    result = CliRunner().invoke(app, ["run", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "Cannot read job file" in result.output
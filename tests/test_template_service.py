@@ -0,0 +1,19 @@
+import pytest
+from portl.services.template_service import TemplateService
+
+
+def test_create_template_file(tmp_path):
+    service = TemplateService()
+    output = tmp_path / service.get_default_template_name()
+    assert service.create_template_file(output) is True
+    assert output.read_text(encoding="utf-8") == service.get_template_content()
+    assert "source:" in output.read_text(encoding="utf-8")
+
+
+def test_create_template_file_refuses_overwrite(tmp_path):
+    service = TemplateService()
+    output = tmp_path / "existing.yaml"
+    output.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        service.create_template_file(output)
+    assert output.read_text() == "keep me"
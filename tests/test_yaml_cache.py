@@ -0,0 +1,67 @@
+import os
+import pytest
+from portl.utils import yaml_cache
+from portl.utils.yaml_cache import clear_cache, load_yaml_cached
+from portl.utils.yaml_io import YamlParseError
+
+
+def write_settled(path, text, age_s=60):
+    """Write a file and backdate its mtime past the racy-write window."""
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - age_s * 1_000_000_000))
+
+
+def test_load_yaml_cached_reads_sidecar(tmp_path, isolated_cache_dir, monkeypatch):
+    job_file = tmp_path / "job.yaml"
+    write_settled(job_file, "batch_size: 100\n")
+    assert load_yaml_cached(job_file) == {"batch_size": 100}
+    assert len(list(isolated_cache_dir.glob("*.pkl"))) == 1
+    
+    def fail_parse(path):
+        raise AssertionError("sidecar was not used")
+    
+    monkeypatch.setattr(yaml_cache, "load_yaml_file", fail_parse)
+    clear_cache()
+    assert load_yaml_cached(job_file) == {"batch_size": 100}
+
+
+def test_load_yaml_cached_reuses_result_in_process(tmp_path):
+    job_file = tmp_path / "job.yaml"
+    job_file.write_text("batch_size: 100\n")
+    assert load_yaml_cached(job_file) is load_yaml_cached(job_file)
+
+
+def test_load_yaml_cached_invalidated_on_change(tmp_path, isolated_cache_dir):
+    job_file = tmp_path / "job.yaml"
+    write_settled(job_file, "batch_size: 100\n", age_s=60)
+    load_yaml_cached(job_file)
+    write_settled(job_file, "batch_size: 2000\n", age_s=30)
+    clear_cache()
+    assert load_yaml_cached(job_file) == {"batch_size": 2000}
+    assert len(list(isolated_cache_dir.glob("*.pkl"))) == 1
+
+
+def test_load_yaml_cached_does_not_cache_errors(tmp_path, isolated_cache_dir):
+    job_file = tmp_path / "job.yaml"
+    job_file.write_text("source: [unclosed\n")
+    with pytest.raises(YamlParseError):
+        load_yaml_cached(job_file)
+    assert not list(isolated_cache_dir.glob("*.pkl"))
+
+
+def test_load_yaml_cached_skips_sidecar_for_racy_file(tmp_path, isolated_cache_dir):
+    job_file = tmp_path / "job.yaml"
+    job_file.write_text("batch_size: 100\n")
+    assert load_yaml_cached(job_file) == {"batch_size": 100}
+    assert not list(isolated_cache_dir.glob("*.pkl"))
+
+
+def test_load_yaml_cached_survives_missing_cache_dir(tmp_path, monkeypatch):
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+    
+    monkeypatch.setattr(yaml_cache, "get_cache_dir", no_home)
+    job_file = tmp_path / "job.yaml"
+    write_settled(job_file, "batch_size: 100\n")
+    assert load_yaml_cached(job_file) == {"batch_size": 100}
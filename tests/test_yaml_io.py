@@ -0,0 +1,50 @@
+import io
+import pytest
+from portl.utils import yaml_io
+from portl.utils.yaml_io import YamlParseError, load_yaml, load_yaml_file, parser_name
+
+
+class StubRyaml:
+    class InvalidYamlError(ValueError):
+        pass
+
+    @staticmethod
+    def loads(text):
+        if "[" in text:
+            raise StubRyaml.InvalidYamlError("unclosed sequence")
+        return {"parsed_by": "ryaml", "text": text}
+
+    @staticmethod
+    def load(stream):
+        return StubRyaml.loads(stream.read().decode("utf-8"))
+
+
+@pytest.fixture
+def stub_ryaml(monkeypatch):
+    monkeypatch.setattr(yaml_io, "_import_ryaml", lambda: StubRyaml)
+    return StubRyaml
+
+
+def test_ryaml_requires_opt_in(stub_ryaml):
+    assert parser_name() == "pyyaml"
+    assert load_yaml("flag: yes\n") == {"flag": True}
+
+
+def test_ryaml_used_when_opted_in(stub_ryaml, monkeypatch):
+    monkeypatch.setenv("PORTL_YAML_PARSER", "ryaml")
+    assert parser_name() == "ryaml"
+    assert load_yaml("a: 1")["parsed_by"] == "ryaml"
+    assert load_yaml(b"a: 1")["parsed_by"] == "ryaml"
+    assert load_yaml(io.BytesIO(b"a: 1"))["parsed_by"] == "ryaml"
+
+
+def test_ryaml_errors_become_yaml_parse_errors(stub_ryaml, monkeypatch, tmp_path):
+    monkeypatch.setenv("PORTL_YAML_PARSER", "ryaml")
+    with pytest.raises(YamlParseError):
+        load_yaml("a: [")
+    job_file = tmp_path / "job.yaml"
+    job_file.write_bytes(b"name: \xff\xfe\n")
+    with pytest.raises(YamlParseError):
+        load_yaml_file(job_file)
+    with pytest.raises(YamlParseError):
+        load_yaml(b"name: \xff\xfe\n")